@@ -0,0 +1,70 @@
+"""
+EPRM Analyzer Monte Carlo 샘플러 비교 (샘플 수 대비 95% CI 오차).
+
+EPRMAnalyzer.compare_samplers()를 기준 단백질 집합(SAMPLER_REFERENCE_SEQUENCES)에
+실행하여 샘플러(random, sobol, halton, lhs)별로 서열당 샘플 수에 따른
+CI 경계의 상대 RMS 오차를 출력합니다. 또한 각 샘플러가 의사난수(random)
+--target-samples 개와 같은 오차에 도달하는 데 필요한 최소 샘플 수를 보고합니다.
+
+사용 방법:
+    python benchmarks/bench_samplers.py
+    python benchmarks/bench_samplers.py --repeats 50 --target-samples 2048
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "eprm_analyzer_v2.4.py"
+
+
+def load_module():
+    """파일 이름에 '.'이 있어 일반 import가 안 되므로 경로로 모듈을 읽습니다."""
+    spec = importlib.util.spec_from_file_location("eprm_analyzer", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=20, help="샘플 수마다 반복 추정 횟수")
+    parser.add_argument(
+        "--reference-iterations", type=int, default=200_000, help="기준 CI 샘플 수"
+    )
+    parser.add_argument(
+        "--target-samples", type=int, default=2048,
+        help="비교 기준이 되는 random 샘플러의 샘플 수 (기본값: 2048)"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    args = parser.parse_args()
+
+    module = load_module()
+    analyzer = module.EPRMAnalyzer(random_seed=args.seed)
+    counts = sorted({64, 128, 256, 512, 1024, 2048, args.target_samples})
+    table = analyzer.compare_samplers(
+        sample_counts=counts, n_repeats=args.repeats,
+        reference_iterations=args.reference_iterations
+    )
+
+    target_error = table["random"][args.target_samples]
+    samples_needed = {
+        sampler: next((n for n in counts if errors[n] <= target_error), None)
+        for sampler, errors in table.items()
+    }
+    print(json.dumps({
+        "relative_ci_rms_error": {
+            sampler: {str(n): round(e, 6) for n, e in errors.items()}
+            for sampler, errors in table.items()
+        },
+        "target": {"sampler": "random", "samples": args.target_samples,
+                   "error": round(target_error, 6)},
+        "samples_needed_for_target": samples_needed,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+EPRM Analyzer 시작 시간(cold start) 벤치마크.
+
+새 Python 프로세스에서 다음을 측정합니다:
+1. numpy import 시간 (비교 기준)
+2. eprm_analyzer 모듈 import 시간 (numpy 제외)
+3. EPRMAnalyzer() 생성 시간
+4. 첫 calculate_eprm() 호출 시간 (include_uncertainty=False)
+
+또한 import/생성/단일 계산 과정에서 부작용(파일 생성, 경고 출력,
+root logger 핸들러 변경)이 없는지 확인합니다. 생성자는 기본값과, 검증 경고를 내는
+기본값이 아닌 인자(최종 부피 < 초기 부피) 두 가지로 확인합니다.
+모듈 import + 생성 + 첫 호출 시간의 중앙값이 예산(--budget-ms)을 넘거나
+부작용이 발견되면 종료 코드 1을 반환합니다.
+
+사용 방법:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 20 --budget-ms 30
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "eprm_analyzer_v2.4.py"
+
+# 자식 프로세스에서 실행되는 측정 코드
+_PROBE = r"""
+import json, logging, os, sys, time, warnings
+warnings.simplefilter("always")
+with warnings.catch_warnings(record=True) as caught:
+    t0 = time.perf_counter()
+    import numpy
+    t1 = time.perf_counter()
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("eprm_analyzer", sys.argv[1])
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    t2 = time.perf_counter()
+    analyzer = module.EPRMAnalyzer()
+    t3 = time.perf_counter()
+    analyzer.calculate_eprm("MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQ", include_uncertainty=False)
+    t4 = time.perf_counter()
+    # 기본값이 아닌 인자 (농축 경고를 내는 부피 포함)로도 부작용이 없어야 함
+    module.EPRMAnalyzer(
+        initial_conc_um=5.0, initial_vol_ul=100.0, final_vol_ul=50.0, buffer_ph=6.5,
+        random_seed=1, mc_tolerance=0.01, log_mode="batch"
+    )
+print(json.dumps({
+    "numpy_import_ms": (t1 - t0) * 1000,
+    "module_import_ms": (t2 - t1) * 1000,
+    "construct_ms": (t3 - t2) * 1000,
+    "first_call_ms": (t4 - t3) * 1000,
+    "warnings": [str(w.message) for w in caught],
+    "files_created": sorted(os.listdir(".")),
+    "root_handlers": len(logging.getLogger().handlers),
+    "bio_imported": "Bio" in sys.modules,
+    "yaml_imported": "yaml" in sys.modules,
+}))
+"""
+
+
+def run_probe() -> dict:
+    """새 프로세스에서 측정 코드를 한 번 실행합니다."""
+    with tempfile.TemporaryDirectory() as cwd:
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE, str(MODULE_PATH)],
+            cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="반복 실행 횟수 (기본값: 10)")
+    parser.add_argument(
+        "--budget-ms", type=float, default=50.0,
+        help="모듈 import + 생성 + 첫 호출 시간 예산 (ms, 기본값: 50)"
+    )
+    args = parser.parse_args()
+
+    probes = [run_probe() for _ in range(args.runs)]
+    timing_keys = ("numpy_import_ms", "module_import_ms", "construct_ms", "first_call_ms")
+    summary = {key: statistics.median(p[key] for p in probes) for key in timing_keys}
+    summary["cold_start_ms"] = (
+        summary["module_import_ms"] + summary["construct_ms"] + summary["first_call_ms"]
+    )
+
+    side_effects = []
+    for probe in probes:
+        if probe["warnings"]:
+            side_effects.append(f"warnings: {probe['warnings']}")
+        if probe["files_created"]:
+            side_effects.append(f"files created: {probe['files_created']}")
+        if probe["root_handlers"]:
+            side_effects.append("root logger handlers were configured")
+        if probe["bio_imported"] or probe["yaml_imported"]:
+            side_effects.append("optional dependency imported eagerly")
+    summary["side_effects"] = sorted(set(side_effects))
+    summary["budget_ms"] = args.budget_ms
+    summary["passed"] = (
+        summary["cold_start_ms"] <= args.budget_ms and not summary["side_effects"]
+    )
+
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    return 0 if summary["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
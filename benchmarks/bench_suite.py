@@ -0,0 +1,296 @@
+"""
+EPRM Analyzer 재현 가능한 성능 벤치마크 모음.
+
+synthetic_proteome.py의 시드 고정 합성 단백질체로 다음을 측정합니다:
+1. calculate_eprm() 단일 서열 지연 시간 (불확실성 제외 / 포함, 중앙값과 p95)
+2. 물성 백엔드별 단일 서열 지연 시간 (native vs biopython, 불확실성 제외)
+3. _calculate_uncertainty()의 n_iterations별 실행 시간
+4. process_files() 전체 처리량 (서열/초, 잔기/초)과 최대 메모리 (새 프로세스에서 실행)
+
+결과는 JSON(--output)으로 저장하고, --baseline으로 이전 결과와 비교할 수 있습니다.
+허용 범위(--tolerance)보다 나빠진 지표가 있거나, 기준 결과가 없어도 native 엔진이
+biopython 백엔드보다 느리면 종료 코드 1을 반환합니다.
+
+사용 방법:
+    python benchmarks/bench_suite.py --output bench_baseline.json
+    python benchmarks/bench_suite.py --baseline bench_baseline.json --tolerance 0.15
+    python benchmarks/bench_suite.py --quick
+"""
+
+import argparse
+import importlib.util
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+BENCH_DIR = Path(__file__).resolve().parent
+MODULE_PATH = BENCH_DIR.parent / "eprm_analyzer_v2.4.py"
+sys.path.insert(0, str(BENCH_DIR))
+
+from synthetic_proteome import generate_sequences  # noqa: E402
+
+# 기본 / --quick 벤치마크 규모
+SCALES = {
+    'default': {
+        'latency_sequences': 200,
+        'uncertainty_iterations': [100, 1000, 10000, 100000],
+        'uncertainty_repeats': 5,
+        'proteome_sequences': 5000,
+        'proteome_files': 4,
+        'duplicate_rate': 0.1,
+    },
+    'quick': {
+        'latency_sequences': 50,
+        'uncertainty_iterations': [100, 1000, 10000],
+        'uncertainty_repeats': 3,
+        'proteome_sequences': 500,
+        'proteome_files': 2,
+        'duplicate_rate': 0.1,
+    },
+}
+
+# 자식 프로세스에서 실행되는 process_files() 측정 코드
+_PROCESS_FILES_PROBE = r"""
+import importlib.util, json, sys
+sys.path.insert(0, sys.argv[2])
+from synthetic_proteome import write_proteome
+spec = importlib.util.spec_from_file_location("eprm_analyzer", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+config = json.loads(sys.argv[3])
+write_proteome(
+    "input", config["sequences"], n_files=config["files"], seed=config["seed"],
+    duplicate_rate=config["duplicate_rate"]
+)
+analyzer = module.EPRMAnalyzer(random_seed=config["seed"], log_mode="quiet")
+profile = analyzer.process_files(
+    "input", include_uncertainty=True, workers=config["workers"], results_format="ndjson"
+)
+try:
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 bytes 단위
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+except ImportError:
+    peak_mb = None
+print(json.dumps({"profile": profile, "peak_rss_mb": peak_mb}))
+"""
+
+
+def load_module():
+    """파일 이름에 '.'이 있어 일반 import가 안 되므로 경로로 모듈을 읽습니다."""
+    spec = importlib.util.spec_from_file_location("eprm_analyzer", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def metric(value: float, unit: str, better: str) -> Dict:
+    """비교 가능한 지표 하나 (better: 'lower' 또는 'higher')."""
+    return {"value": value, "unit": unit, "better": better}
+
+
+def time_calls(func: Callable[[], object], repeats: int) -> List[float]:
+    """func를 repeats번 호출한 각 실행 시간 (ms)."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def bench_latency(module, sequences: List[str], seed: int) -> Dict[str, Dict]:
+    """calculate_eprm() 단일 서열 지연 시간 (불확실성 제외 / 포함)."""
+    analyzer = module.EPRMAnalyzer(random_seed=seed)
+    analyzer.calculate_eprm(sequences[0], include_uncertainty=True)  # 첫 호출 준비 비용 제외
+    metrics = {}
+    for label, include_uncertainty in (("no_uncertainty", False), ("uncertainty", True)):
+        times = []
+        for seq in sequences:
+            rng = analyzer._sequence_rng(seq)
+            times += time_calls(
+                lambda: analyzer.calculate_eprm(
+                    seq, include_uncertainty=include_uncertainty, rng=rng
+                ), 1
+            )
+        metrics[f"latency_{label}_median_ms"] = metric(statistics.median(times), "ms", "lower")
+        metrics[f"latency_{label}_p95_ms"] = metric(
+            float(np.percentile(times, 95)), "ms", "lower"
+        )
+    return metrics
+
+
+def bench_property_backends(module, sequences: List[str], seed: int) -> Dict[str, Dict]:
+    """
+    물성 백엔드별 calculate_eprm(include_uncertainty=False) 서열당 지연 시간 (중앙값).
+
+    Biopython이 설치되어 있으면 native / biopython 지연 시간 비율도 기록합니다
+    (1보다 크면 기본 엔진이 참조 백엔드보다 느린 것).
+    """
+    medians = {}
+    metrics = {}
+    for backend in module.PROPERTY_BACKENDS:
+        if backend == 'biopython' and module._load_protein_analysis() is None:
+            continue
+        analyzer = module.EPRMAnalyzer(random_seed=seed, property_backend=backend)
+        analyzer.calculate_eprm(sequences[0], include_uncertainty=False)  # 첫 호출 준비 비용 제외
+        times = []
+        for seq in sequences:
+            times += time_calls(lambda: analyzer.calculate_eprm(seq, include_uncertainty=False), 1)
+        medians[backend] = statistics.median(times)
+        metrics[f"latency_{backend}_backend_median_ms"] = metric(medians[backend], "ms", "lower")
+    if 'biopython' in medians:
+        metrics["latency_native_vs_biopython_ratio"] = metric(
+            medians['native'] / medians['biopython'], "x", "lower"
+        )
+    return metrics
+
+
+def bench_uncertainty(module, iterations: List[int], repeats: int, seed: int) -> Dict[str, Dict]:
+    """_calculate_uncertainty()의 n_iterations별 실행 시간 (중앙값)."""
+    analyzer = module.EPRMAnalyzer(random_seed=seed)
+    metrics = {}
+    for n_iterations in iterations:
+        times = time_calls(
+            lambda: analyzer._calculate_uncertainty(
+                "", 45.0, -0.3, 6.8, n_iterations, rng=np.random.default_rng(seed)
+            ), repeats
+        )
+        metrics[f"uncertainty_{n_iterations}_ms"] = metric(statistics.median(times), "ms", "lower")
+    return metrics
+
+
+def bench_process_files(config: Dict) -> Dict:
+    """새 프로세스에서 합성 단백질체를 만들고 process_files() 처리량과 최대 메모리를 잽니다."""
+    with tempfile.TemporaryDirectory() as cwd:
+        output = subprocess.run(
+            [sys.executable, "-c", _PROCESS_FILES_PROBE, str(MODULE_PATH), str(BENCH_DIR),
+             json.dumps(config)],
+            cwd=cwd, capture_output=True, text=True, check=True
+        ).stdout
+    result = json.loads(output)
+    profile = result["profile"]
+    metrics = {
+        "process_files_sequences_per_sec": metric(
+            profile["sequences_per_sec"], "seq/s", "higher"
+        ),
+        "process_files_residues_per_sec": metric(
+            profile["residues_per_sec"], "residues/s", "higher"
+        ),
+        "process_files_wall_sec": metric(profile["wall_sec"], "s", "lower"),
+    }
+    if result["peak_rss_mb"] is not None:
+        metrics["process_files_peak_rss_mb"] = metric(result["peak_rss_mb"], "MB", "lower")
+    stages = {
+        name: round(stats["wall_fraction"], 4) for name, stats in profile["stages"].items()
+    }
+    return {"metrics": metrics, "stage_wall_fraction": stages}
+
+
+def compare(metrics: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> Dict:
+    """
+    기준 결과와 지표별 변화율을 비교합니다.
+
+    Returns:
+        Dict: 지표 이름 -> baseline, current, change (상대 변화), regression 여부
+    """
+    comparison = {}
+    for name, current in metrics.items():
+        if name not in baseline or not baseline[name]["value"]:
+            continue
+        base = baseline[name]["value"]
+        change = current["value"] / base - 1
+        worse = change if current["better"] == "lower" else -change
+        comparison[name] = {
+            "baseline": base,
+            "current": current["value"],
+            "change": round(change, 4),
+            "regression": worse > tolerance,
+        }
+    return comparison
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="작은 규모로 빠르게 실행")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 / Monte Carlo 시드")
+    parser.add_argument("--workers", type=int, default=1, help="process_files() 프로세스 수")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 경로")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.10,
+        help="회귀로 판단하는 상대 악화 비율 (기본값: 0.10 = 10%%)"
+    )
+    args = parser.parse_args()
+
+    scale = SCALES['quick' if args.quick else 'default']
+    module = load_module()
+
+    sequences = generate_sequences(scale['latency_sequences'], seed=args.seed)
+    metrics = bench_latency(module, sequences, args.seed)
+    metrics.update(bench_property_backends(module, sequences, args.seed))
+    metrics.update(bench_uncertainty(
+        module, scale['uncertainty_iterations'], scale['uncertainty_repeats'], args.seed
+    ))
+    process_files = bench_process_files({
+        "sequences": scale['proteome_sequences'],
+        "files": scale['proteome_files'],
+        "duplicate_rate": scale['duplicate_rate'],
+        "seed": args.seed,
+        "workers": args.workers,
+    })
+    metrics.update(process_files["metrics"])
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "config": {"scale": 'quick' if args.quick else 'default', "seed": args.seed,
+                   "workers": args.workers, **scale},
+        "metrics": metrics,
+        "process_files_stage_wall_fraction": process_files["stage_wall_fraction"],
+    }
+
+    passed = True
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get("config") != report["config"]:
+            print("경고: 기준 결과와 벤치마크 설정이 달라 비교가 의미 없을 수 있습니다.",
+                  file=sys.stderr)
+        report["comparison"] = compare(metrics, baseline["metrics"], args.tolerance)
+        report["tolerance"] = args.tolerance
+        passed = not any(entry["regression"] for entry in report["comparison"].values())
+        report["passed"] = passed
+
+    # 기본(native) 물성 엔진은 기준 결과와 무관하게 참조 백엔드보다 빨라야 함
+    backend_ratio = metrics.get("latency_native_vs_biopython_ratio")
+    if backend_ratio is not None and backend_ratio["value"] > 1.0:
+        print(
+            f"native 물성 엔진이 biopython 백엔드보다 느립니다 "
+            f"({backend_ratio['value']:.2f}배).", file=sys.stderr
+        )
+        passed = False
+        report["passed"] = passed
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+EPRM Analyzer 벤치마크용 합성 단백질체(FASTA) 생성기.
+
+시드가 같으면 항상 같은 FASTA 파일 묶음을 만듭니다. 다음을 설정할 수 있습니다:
+- 서열 길이 분포: 로그정규 (중앙값, sigma, 최소/최대 길이로 제한)
+- 아미노산 조성: 'uniprot' (UniProtKB/Swiss-Prot 평균 빈도) 또는 'uniform'
+- 파일 수: 레코드를 여러 .fasta 파일에 나누어 저장
+- 중복 비율: 앞서 나온 서열을 그대로 반복하는 레코드의 비율 (파일 간 중복 포함)
+
+사용 방법:
+    python benchmarks/synthetic_proteome.py ./synthetic --sequences 10000 --files 4
+    python benchmarks/synthetic_proteome.py ./synthetic --duplicate-rate 0.2 --seed 7
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+# 20가지 표준 아미노산
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+# UniProtKB/Swiss-Prot 평균 아미노산 조성 (%)
+UNIPROT_COMPOSITION = {
+    'A': 8.25, 'C': 1.37, 'D': 5.45, 'E': 6.75, 'F': 3.86,
+    'G': 7.07, 'H': 2.27, 'I': 5.96, 'K': 5.84, 'L': 9.66,
+    'M': 2.42, 'N': 4.06, 'P': 4.70, 'Q': 3.93, 'R': 5.53,
+    'S': 6.56, 'T': 5.34, 'V': 6.87, 'W': 1.08, 'Y': 2.92,
+}
+
+COMPOSITIONS = ('uniprot', 'uniform')
+
+# FASTA 서열 줄 길이
+FASTA_LINE_WIDTH = 60
+
+
+def composition_probabilities(composition: str) -> np.ndarray:
+    """
+    조성 이름을 AMINO_ACIDS 순서의 확률 벡터로 바꿉니다.
+
+    Raises:
+        ValueError: 지원하지 않는 조성 이름인 경우
+    """
+    if composition == 'uniprot':
+        weights = np.array([UNIPROT_COMPOSITION[aa] for aa in AMINO_ACIDS])
+    elif composition == 'uniform':
+        weights = np.ones(len(AMINO_ACIDS))
+    else:
+        raise ValueError(f"지원하지 않는 조성입니다: {composition}. {COMPOSITIONS} 중 하나를 선택해주세요.")
+    return weights / weights.sum()
+
+
+def generate_sequences(
+    n_sequences: int,
+    seed: int = 0,
+    length_median: float = 300.0,
+    length_sigma: float = 0.6,
+    min_length: int = 30,
+    max_length: int = 2000,
+    composition: str = 'uniprot',
+    duplicate_rate: float = 0.0
+) -> List[str]:
+    """
+    시드 고정 합성 서열 목록을 만듭니다 (모든 서열은 Met으로 시작).
+
+    Args:
+        n_sequences (int): 레코드 수 (중복 포함)
+        seed (int): 난수 시드
+        length_median (float): 로그정규 길이 분포의 중앙값
+        length_sigma (float): 로그정규 길이 분포의 sigma (로그 스케일 표준편차)
+        min_length, max_length (int): 길이 제한
+        composition (str): 'uniprot' 또는 'uniform'
+        duplicate_rate (float): 앞서 나온 서열을 반복하는 레코드 비율 (0 ~ 1)
+
+    Returns:
+        List[str]: n_sequences개의 서열
+
+    Raises:
+        ValueError: 파라미터가 범위를 벗어난 경우
+    """
+    if not 0 <= duplicate_rate < 1:
+        raise ValueError(f"duplicate_rate는 0 이상 1 미만이어야 합니다: {duplicate_rate}")
+    if not 2 <= min_length <= max_length:
+        raise ValueError(f"길이 범위가 올바르지 않습니다: {min_length} ~ {max_length}")
+
+    rng = np.random.default_rng(seed)
+    probabilities = composition_probabilities(composition)
+    letters = np.frombuffer(AMINO_ACIDS.encode('ascii'), dtype=np.uint8)
+    is_duplicate = rng.random(n_sequences) < duplicate_rate
+    is_duplicate[0] = False
+    lengths = np.clip(
+        np.round(rng.lognormal(np.log(length_median), length_sigma, n_sequences)),
+        min_length, max_length
+    ).astype(int)
+
+    # 고유 서열은 한 번에 생성한 잔기 배열을 길이대로 잘라 만듦
+    unique_lengths = lengths[~is_duplicate]
+    residues = letters[rng.choice(len(letters), size=int(unique_lengths.sum()), p=probabilities)]
+    offsets = np.concatenate([[0], np.cumsum(unique_lengths)])
+    unique = [
+        'M' + residues[start + 1:end].tobytes().decode('ascii')
+        for start, end in zip(offsets[:-1], offsets[1:])
+    ]
+
+    sequences: List[str] = []
+    next_unique = iter(unique)
+    for i in range(n_sequences):
+        if is_duplicate[i]:
+            sequences.append(sequences[rng.integers(i)])
+        else:
+            sequences.append(next(next_unique))
+    return sequences
+
+
+def write_proteome(
+    output_dir: str,
+    n_sequences: int,
+    n_files: int = 1,
+    seed: int = 0,
+    **options
+) -> Dict:
+    """
+    합성 서열을 n_files개의 FASTA 파일로 나누어 저장합니다.
+
+    Args:
+        output_dir (str): 저장 디렉토리 (없으면 생성)
+        n_sequences (int): 전체 레코드 수
+        n_files (int): 파일 수 (레코드를 순서대로 거의 같은 크기로 나눔)
+        seed (int): 난수 시드
+        **options: generate_sequences()의 나머지 인자
+
+    Returns:
+        Dict: 생성 요약 (files, sequences, unique_sequences, residues, seed, options)
+    """
+    if n_files < 1:
+        raise ValueError(f"파일 수는 1 이상이어야 합니다: {n_files}")
+    sequences = generate_sequences(n_sequences, seed=seed, **options)
+    os.makedirs(output_dir, exist_ok=True)
+
+    files = []
+    bounds = np.linspace(0, n_sequences, n_files + 1).astype(int)
+    for file_index, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        path = os.path.join(output_dir, f"synthetic_{file_index:03d}.fasta")
+        with open(path, 'w', encoding='utf-8') as f:
+            for i in range(start, end):
+                seq = sequences[i]
+                f.write(f">synthetic_{i:07d} len={len(seq)}\n")
+                for pos in range(0, len(seq), FASTA_LINE_WIDTH):
+                    f.write(seq[pos:pos + FASTA_LINE_WIDTH])
+                    f.write('\n')
+        files.append(path)
+
+    return {
+        "files": files,
+        "sequences": n_sequences,
+        "unique_sequences": len(set(sequences)),
+        "residues": sum(len(seq) for seq in sequences),
+        "seed": seed,
+        "options": options,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("output_dir", help="FASTA 파일을 저장할 디렉토리")
+    parser.add_argument("--sequences", type=int, default=10000, help="레코드 수 (기본값: 10000)")
+    parser.add_argument("--files", type=int, default=1, help="파일 수 (기본값: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--length-median", type=float, default=300.0, help="길이 중앙값")
+    parser.add_argument("--length-sigma", type=float, default=0.6, help="로그정규 sigma")
+    parser.add_argument("--min-length", type=int, default=30, help="최소 길이")
+    parser.add_argument("--max-length", type=int, default=2000, help="최대 길이")
+    parser.add_argument("--composition", choices=COMPOSITIONS, default='uniprot', help="아미노산 조성")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="중복 레코드 비율 (0 ~ 1)")
+    args = parser.parse_args()
+
+    summary = write_proteome(
+        args.output_dir, args.sequences, n_files=args.files, seed=args.seed,
+        length_median=args.length_median, length_sigma=args.length_sigma,
+        min_length=args.min_length, max_length=args.max_length,
+        composition=args.composition, duplicate_rate=args.duplicate_rate
+    )
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+EPRM Analyzer 테스트 공통 fixture.
+
+eprm_analyzer_v2.4.py는 파일 이름에 '.'이 있어 일반 import가 안 되므로
+경로로 모듈을 읽습니다. 프로세스 풀(workers > 1)에서 함수를 pickle할 수 있도록
+sys.modules에도 등록합니다.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parent.parent / "eprm_analyzer_v2.4.py"
+MODULE_NAME = "eprm_analyzer"
+
+
+@pytest.fixture(scope="session")
+def eprm():
+    """경로로 읽은 eprm_analyzer 모듈."""
+    if MODULE_NAME not in sys.modules:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, MODULE_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module
+        spec.loader.exec_module(module)
+    return sys.modules[MODULE_NAME]
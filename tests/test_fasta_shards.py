@@ -0,0 +1,88 @@
+"""
+샤드 분할 테스트: 모든 샤드를 합치면 전체 실행과 같고, 샤드끼리 겹치지 않아야 합니다.
+
+일반 파일은 FastaIndex 바이트 구간으로, 압축 파일은 레코드 번호 % 샤드 수로 나눕니다.
+"""
+
+import gzip
+import json
+from collections import Counter
+
+import pytest
+
+N_RECORDS = 41
+
+# 일반 파일(바이트 구간)과 압축 파일(레코드 번호 % 샤드 수) 두 경로를 모두 확인
+FILE_NAMES = ["proteome.fasta", "proteome.fasta.gz"]
+
+
+def _fasta_text() -> str:
+    """줄바꿈 위치와 레코드 길이가 제각각인 고정 FASTA 텍스트 (중복 서열 포함)."""
+    lines = []
+    for i in range(N_RECORDS):
+        seq = "MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQ"[: 12 + i % 20] + "ACDEFGHIKLMNPQRSTVWY" * (i % 4)
+        lines.append(f">prot_{i} synthetic record {i}")
+        width = 10 + 7 * (i % 3)
+        lines.extend(seq[j:j + width] for j in range(0, len(seq), width))
+        if i % 5 == 0:
+            lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+def _write_input(directory, file_name: str) -> str:
+    """FASTA 파일 하나를 directory에 쓰고 경로를 반환합니다."""
+    directory.mkdir(exist_ok=True)
+    path = directory / file_name
+    data = _fasta_text().encode("ascii")
+    path.write_bytes(gzip.compress(data) if file_name.endswith(".gz") else data)
+    return str(path)
+
+
+@pytest.mark.parametrize("file_name", FILE_NAMES)
+@pytest.mark.parametrize("n_shards", [1, 2, 3, 7, N_RECORDS + 5])
+def test_shard_records_partition_file(eprm, tmp_path, file_name, n_shards):
+    """샤드별 레코드를 합치면 전체 레코드와 같고, 같은 레코드가 두 샤드에 나오지 않습니다."""
+    path = _write_input(tmp_path / "input", file_name)
+    analyzer = eprm.EPRMAnalyzer(log_mode="quiet")
+    full = list(analyzer._iter_file_records(path))
+    assert len(full) == N_RECORDS
+
+    shards = [
+        list(analyzer._iter_file_records(path, shard=(k, n_shards))) for k in range(n_shards)
+    ]
+    counts = Counter(record for records in shards for record in records)
+
+    assert sorted(counts) == sorted(full)
+    assert set(counts.values()) == {1}
+
+
+@pytest.mark.parametrize("file_name", FILE_NAMES)
+def test_sharded_process_files_matches_full_run(eprm, tmp_path, monkeypatch, file_name):
+    """process_files(shard=...) 결과를 합치면 샤드 없이 실행한 결과와 같습니다."""
+    input_dir = tmp_path / "input"
+    _write_input(input_dir, file_name)
+
+    def run(name, shard=None):
+        # 샤드마다 다른 작업 디렉토리에서 실행 (결과 디렉토리 이름은 타임스탬프 기반)
+        run_dir = tmp_path / name
+        run_dir.mkdir()
+        monkeypatch.chdir(run_dir)
+        analyzer = eprm.EPRMAnalyzer(random_seed=7, log_mode="quiet")
+        analyzer.process_files(
+            str(input_dir), include_uncertainty=True, results_format="ndjson", shard=shard
+        )
+        with open(run_dir / analyzer.output_dir / "results.ndjson", encoding="utf-8") as f:
+            return [
+                (entry["header"], json.dumps(entry["results"], sort_keys=True))
+                for entry in map(json.loads, f)
+            ]
+
+    full = run("full")
+    n_shards = 3
+    sharded = [run(f"shard{k}", shard=(k, n_shards)) for k in range(n_shards)]
+    counts = Counter(entry for entries in sharded for entry in entries)
+
+    assert len(full) == N_RECORDS
+    assert all(sharded)
+    assert sorted(counts) == sorted(full)
+    assert set(counts.values()) == {1}
@@ -0,0 +1,46 @@
+"""
+batch / quiet 로깅 테스트: 여러 번 실행해도 리스너 스레드와 로그 파일이 남지 않아야 합니다.
+"""
+
+import logging
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def fasta_dir(tmp_path):
+    """서열 두 개짜리 FASTA 입력 디렉토리."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "a.fasta").write_text(
+        ">a\nMKTAYIAKQRQISFVKSHFSRQ\n>b\nGIGAVLKVLTTGLPALISWIKRKRQQ\n", encoding="ascii"
+    )
+    return input_dir
+
+
+def test_repeated_runs_do_not_leak_listeners(eprm, tmp_path, monkeypatch, fasta_dir):
+    """분석기를 새로 만들거나 같은 분석기로 다시 실행해도 리스너 스레드가 늘지 않습니다."""
+    baseline_threads = threading.active_count()
+    file_handlers = []
+    try:
+        for i, log_mode in enumerate(("batch", "quiet", "batch")):
+            # 결과 디렉토리 이름이 초 단위 타임스탬프이므로 분석기마다 다른 작업 디렉토리 사용
+            run_dir = tmp_path / f"run{i}"
+            run_dir.mkdir()
+            monkeypatch.chdir(run_dir)
+            analyzer = eprm.EPRMAnalyzer(random_seed=1, log_mode=log_mode)
+            for _ in range(2):
+                analyzer.process_files(str(fasta_dir), include_uncertainty=False)
+                assert threading.active_count() == baseline_threads
+            file_handlers.extend(
+                handler for handler in analyzer._log_listener.handlers
+                if isinstance(handler, logging.FileHandler)
+            )
+
+        # 마지막 설정의 로그 파일만 열려 있음
+        assert [handler.stream is None for handler in file_handlers] == [True, True, False]
+        with open(run_dir / analyzer.log_path, encoding="utf-8") as f:
+            assert f.read().count('"header"') == 4
+    finally:
+        eprm._reset_root_logging()
@@ -0,0 +1,20 @@
+"""
+내장(native) 물성 엔진 테스트: 단일 서열 경로와 배치 경로의 결과가 같아야 합니다.
+"""
+
+import numpy as np
+
+
+def test_single_sequence_pi_matches_batch(eprm):
+    """순수 Python pI 이분법(단일 서열)과 벡터화 이분법(배치)은 같은 값을 냅니다."""
+    rng = np.random.default_rng(0)
+    residues = list(eprm.AMINO_ACID_ORDER)
+    sequences = ["".join(rng.choice(residues, int(n))) for n in rng.integers(2, 600, 500)]
+    # 말단 잔기 pKa 보정과 극단적인 전하 조성
+    sequences += [a + b for a in residues for b in residues]
+    sequences += ["K" * 40, "D" * 40, "mktayiakqr"]
+
+    batch = eprm.compute_native_properties_batch(sequences)
+    single = np.array([eprm.compute_native_properties(seq)[3] for seq in sequences])
+
+    np.testing.assert_array_equal(single, batch["pI"])
@@ -0,0 +1,40 @@
+"""
+내장(native) 물성 엔진과 Biopython 참조 백엔드의 일치 여부 테스트.
+
+Biopython이 설치되지 않은 환경에서는 건너뜁니다.
+"""
+
+import pytest
+
+pytest.importorskip("Bio.SeqUtils.ProtParam")
+
+# 고정 서열: 말단 잔기(pKa 보정), C/Y/H 포함 여부, 소수성/친수성, 길이가 서로 다르도록 고름
+SEQUENCES = [
+    # Ubiquitin (Homo sapiens)
+    "MQIFVKTLTGKTITLEVEPSDTIENVKAKIQDKEGIPPDQQRLIFAGKQLEDGRTLSDYNIQKESTLHLVLRLRGG",
+    # Insulin B chain
+    "FVNQHLCGSHLVEALYLVCGERGFFYTPKT",
+    # Green fluorescent protein (Aequorea victoria)
+    "MSKGEELFTGVVPILVELDGDVNGHKFSVSGEGEGDATYGKLTLKFICTTGKLPVPWPTLVTTFSYGVQCFSRYPDHMKQ"
+    "HDFFKSAMPEGYVQERTIFFKDDGNYKTRAEVKFEGDTLVNRIELKGIDFKEDGNILGHKLEYNYNSHNVYIMADKQKNG"
+    "IKVNFKIRHNIEDGSVQLADHYQQNTPIGDGPVLLPDNHYLSTQSALSKDPNEKRDHMVLLEFVTAAGITHGMDELYK",
+    # Melittin (소수성, 염기성)
+    "GIGAVLKVLTTGLPALISWIKRKRQQ",
+    # 산성 반복 서열 (C-말단 E)
+    "DEDEDEDEDEDEDEDEDEDE",
+    # 표준 아미노산 20가지 전부
+    "ACDEFGHIKLMNPQRSTVWY",
+]
+
+
+def test_native_matches_biopython_within_tolerance(eprm):
+    """모든 물성의 최대 절대 오차가 PROPERTY_TOLERANCES 이내여야 합니다."""
+    analyzer = eprm.EPRMAnalyzer(log_mode="quiet")
+    report = analyzer.compare_property_backends(SEQUENCES)
+
+    assert set(report) == set(eprm.PROPERTY_TOLERANCES)
+    for key, tolerance in eprm.PROPERTY_TOLERANCES.items():
+        assert report[key]["tolerance"] == tolerance
+        assert report[key]["max_abs_error"] <= tolerance, key
+        assert report[key]["within_tolerance"], key
+
@@ -0,0 +1,39 @@
+"""
+배치 불확실성 계산의 경계 조건 테스트 (빈 입력, 적응형 최소 반복 횟수).
+"""
+
+import pytest
+
+# 불확실성 계산 경로: 일반 / 스트리밍 / 적응형 Monte Carlo와 해석적 전파
+UNCERTAINTY_OPTIONS = [
+    {},
+    {"mc_streaming": True},
+    {"mc_tolerance": 0.01},
+    {"uncertainty": "analytic"},
+]
+
+
+@pytest.mark.parametrize("options", UNCERTAINTY_OPTIONS)
+def test_empty_batch_returns_empty_columns(eprm, options):
+    """서열이 0개여도 calculate_eprm_batch와 plan_experiments는 빈 열을 반환합니다."""
+    analyzer = eprm.EPRMAnalyzer(random_seed=1, log_mode="quiet", **options)
+
+    batch = analyzer.calculate_eprm_batch([], include_uncertainty=True)
+    assert len(batch["C_Effective_uM"]) == 0
+    assert len(batch["MC_Iterations"]) == 0
+
+    plan = analyzer.plan_experiments([], [])
+    assert len(plan["Prob_Below_Target"]) == 0
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_adaptive_requires_two_iterations(eprm, streaming):
+    """mc_tolerance를 지정하면 n_iterations는 2 이상이어야 합니다."""
+    analyzer = eprm.EPRMAnalyzer(
+        random_seed=1, log_mode="quiet", mc_tolerance=0.01, mc_streaming=streaming
+    )
+    with pytest.raises(ValueError):
+        analyzer.calculate_eprm("MKTAYIAKQRQISFVKSHFSRQ", n_iterations=1)
+
+    result = analyzer.calculate_eprm("MKTAYIAKQRQISFVKSHFSRQ", n_iterations=2)
+    assert result["MC_Iterations"] == 2